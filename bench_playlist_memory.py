@@ -0,0 +1,111 @@
+# bench_playlist_memory.py
+"""
+Peak-RSS benchmark for large playlists.
+
+Drives a real yt_dlp.YoutubeDL against a synthetic playlist extractor (no
+network, simulate mode) and reports the process's peak RSS for different
+playlist sizes, with and without downloader.LAZY_PLAYLIST_OPTS. Each run
+happens in a fresh subprocess because ru_maxrss is a per-process high-water
+mark.
+
+Usage:
+    python bench_playlist_memory.py                 # 100 vs 10000 entries, eager vs lazy
+    python bench_playlist_memory.py --sizes 100 50000
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+import yt_dlp
+from yt_dlp.extractor.common import InfoExtractor
+
+from downloader import LAZY_PLAYLIST_OPTS
+
+# yt-dlp renders a formats table for every video, so keep formats few (runtime)
+# and make up the size of a real info dict with other per-video metadata instead
+FORMATS_PER_VIDEO = 6
+HEATMAP_POINTS = 100
+
+
+class SyntheticVideoIE(InfoExtractor):
+    """Returns a video info dict sized like a real one, without any network access."""
+    _VALID_URL = r'synthetic:video:(?P<id>\d+)'
+
+    def _real_extract(self, url):
+        video_id = self._match_id(url)
+        return {
+            'id': video_id,
+            'title': f'Synthetic video {video_id}',
+            'description': 'Lorem ipsum dolor sit amet. ' * 60,
+            'tags': [f'tag{i}' for i in range(20)],
+            'heatmap': [{'start_time': i, 'end_time': i + 1, 'value': i / HEATMAP_POINTS}
+                        for i in range(HEATMAP_POINTS)],
+            'formats': [{
+                'format_id': str(i),
+                'url': f'https://media.invalid/{video_id}/{i}.mp4?sig={"0" * 1000}',
+                'ext': 'mp4',
+                'height': 144 * (i % 8 + 1),
+                'tbr': 100 + i,
+            } for i in range(FORMATS_PER_VIDEO)],
+        }
+
+
+class SyntheticPlaylistIE(InfoExtractor):
+    """Yields N lightweight url entries pointing at SyntheticVideoIE."""
+    _VALID_URL = r'synthetic:playlist:(?P<id>\d+)'
+
+    def _real_extract(self, url):
+        count = int(self._match_id(url))
+        entries = (self.url_result(f'synthetic:video:{i}', SyntheticVideoIE) for i in range(count))
+        return self.playlist_result(entries, f'synthetic-{count}', f'Synthetic playlist ({count})')
+
+
+def run_once(entries, lazy):
+    """Processes one synthetic playlist in this process and prints 'peak_kib seconds'."""
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'simulate': True, # Full extraction and format selection, no download
+        'format': 'best',
+        'ignoreerrors': True,
+    }
+    if lazy:
+        ydl_opts.update(LAZY_PLAYLIST_OPTS)
+
+    start = time.perf_counter()
+    with yt_dlp.YoutubeDL(ydl_opts, auto_init=False) as ydl:
+        ydl.add_info_extractor(SyntheticVideoIE())
+        ydl.add_info_extractor(SyntheticPlaylistIE())
+        ydl.download([f'synthetic:playlist:{entries}'])
+    elapsed = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak //= 1024 # macOS reports bytes, Linux KiB
+    print(f"{peak} {elapsed:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10000])
+    parser.add_argument('--run', type=int, help=argparse.SUPPRESS) # Child process mode
+    parser.add_argument('--lazy', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run is not None:
+        run_once(args.run, args.lazy)
+        return
+
+    print(f"{'mode':<6} {'entries':>8} {'peak RSS (MiB)':>15} {'time (s)':>9}")
+    for lazy in (False, True):
+        for size in args.sizes:
+            cmd = [sys.executable, __file__, '--run', str(size)] + (['--lazy'] if lazy else [])
+            out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout.split()
+            peak_kib, elapsed = int(out[-2]), out[-1]
+            print(f"{'lazy' if lazy else 'eager':<6} {size:>8} {peak_kib / 1024:>15.1f} {elapsed:>9}")
+
+
+if __name__ == '__main__':
+    main()
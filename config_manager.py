@@ -5,6 +5,7 @@ import os
 CONFIG_FILE = 'config.ini'
 DEFAULT_SECTION = 'Settings'
 LAST_DIR_KEY = 'last_download_directory'
+LOG_LEVEL_KEY = 'log_level'
 
 def load_settings():
     """Loads settings from the CONFIG_FILE."""
@@ -15,6 +16,7 @@ def load_settings():
             config.read(CONFIG_FILE)
             if DEFAULT_SECTION in config:
                 settings[LAST_DIR_KEY] = config[DEFAULT_SECTION].get(LAST_DIR_KEY)
+                settings[LOG_LEVEL_KEY] = config[DEFAULT_SECTION].get(LOG_LEVEL_KEY)
         except configparser.Error as e:
             print(f"Error reading config file {CONFIG_FILE}: {e}")
             # Optionally return default settings or raise error
@@ -28,6 +30,9 @@ def save_settings(settings):
     if LAST_DIR_KEY in settings and settings[LAST_DIR_KEY]:
         config[DEFAULT_SECTION][LAST_DIR_KEY] = settings[LAST_DIR_KEY]
         
+    if LOG_LEVEL_KEY in settings and settings[LOG_LEVEL_KEY]:
+        config[DEFAULT_SECTION][LOG_LEVEL_KEY] = settings[LOG_LEVEL_KEY]
+
     try:
         with open(CONFIG_FILE, 'w') as configfile:
             config.write(configfile)
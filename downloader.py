@@ -3,19 +3,33 @@ import os
 import traceback
 import yt_dlp
 
+# Process playlist entries as they arrive and don't keep their info dicts
+# in the playlist result, so memory stays flat on very large playlists
+LAZY_PLAYLIST_OPTS = {
+    'lazy_playlist': True,
+    'extract_flat': 'discard_in_playlist',
+}
+
 # --- Custom Logger Class (internal to this module) ---
 class _YdlpLogger:
     """Internal logger to route yt-dlp messages via callback."""
     def __init__(self, log_callback):
         self._log = log_callback
+        # StructuredLogger exposes is_enabled(); plain callbacks never received debug output
+        self._is_enabled = getattr(log_callback, 'is_enabled', lambda level: level != 'debug')
 
     def debug(self, msg):
-        # Remove "[debug] " prefix for cleaner logging if shown
+        # yt-dlp sends every debug and progress line here: check the level before any work
+        if not self._is_enabled('debug'):
+            return
+        # Remove "[debug] " prefix for cleaner logging
         if msg.startswith('[debug] '):
             msg = msg[len('[debug] '):]
-        # Pass debug messages only if explicitly needed by caller (e.g., via log level)
-        # self._log('debug', msg)
-        pass
+        self._log('debug', msg)
+
+    def is_enabled(self, level):
+        """Returns True if messages at 'level' reach the log callback."""
+        return self._is_enabled(level)
 
     def info(self, msg):
          # Exclude progress hook messages if they start with standard download prefix
@@ -94,7 +108,9 @@ class Downloader:
                                           'percent' is float (0-100) or None if indeterminate.
             log_callback (callable): Function to call for logging messages.
                                      Expected signature: func(level, message)
-                                     'level' is str ('info', 'warning', 'error').
+                                     'level' is str ('debug', 'info', 'warning', 'error').
+                                     A log_manager.StructuredLogger may be passed; its
+                                     is_enabled() then gates debug output.
 
         Returns:
             bool: True if the download process completed without critical errors, False otherwise.
@@ -123,6 +139,7 @@ class Downloader:
             'nocheckcertificate': True, # Use with caution
             'addmetadata': True,
             'ignoreerrors': True, # Critical for playlists; errors logged by hook/logger
+            **LAZY_PLAYLIST_OPTS,
             # Optional: Specify ffmpeg path if needed
             # 'ffmpeg_location': '/path/to/ffmpeg'
         }
@@ -157,12 +174,15 @@ class Downloader:
                 'merge_output_format': 'mkv',
             })
 
-        # --- Log Final Options ---
-        log_callback('info', "\n--- Effective yt-dlp Options ---")
-        for key, value in ydl_opts.items():
-            if key != 'logger' and key != 'progress_hooks': # Avoid logging objects
-                 log_callback('info', f"{key}: {value}")
-        log_callback('info', "------------------------------\n")
+        # --- Log Final Options (debug only, skipped entirely unless enabled) ---
+        # Only a StructuredLogger enables debug, so values are passed as %-args
+        # and formatted on its writer thread
+        if internal_logger.is_enabled('debug'):
+            log_callback('debug', "--- Effective yt-dlp Options ---")
+            for key, value in ydl_opts.items():
+                if key != 'logger' and key != 'progress_hooks': # Avoid logging objects
+                     log_callback('debug', "%s: %s", key, value)
+            log_callback('debug', "------------------------------")
 
         # --- Execute Download ---
         download_successful = False
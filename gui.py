@@ -3,6 +3,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
 import threading
+import queue
 import sys
 import traceback
 import subprocess
@@ -11,6 +12,7 @@ import re # For basic URL validation
 # Import logic and config modules
 from downloader import Downloader
 import config_manager
+import log_manager
 
 # --- Helper function for icon path ---
 def get_resource_path(relative_path):
@@ -130,6 +132,17 @@ class DownloaderApp:
         self.log_area.grid(row=5, column=1, columnspan=2, padx=5, pady=(5,10), sticky=tk.NSEW)
         self.log_area.configure(state='disabled')
 
+        # --- Structured Logging ---
+        # The writer thread hands batches to _log_queue; the main loop drains it into the log area
+        self._log_queue = queue.Queue()
+        log_level = (self.settings.get(config_manager.LOG_LEVEL_KEY) or log_manager.DEFAULT_LEVEL).lower()
+        if log_level not in log_manager.LEVELS:
+            print(f"Warning: Invalid {config_manager.LOG_LEVEL_KEY} '{log_level}' in {config_manager.CONFIG_FILE}. "
+                  f"Using '{log_manager.DEFAULT_LEVEL}'.")
+            log_level = log_manager.DEFAULT_LEVEL
+        self.logger = log_manager.StructuredLogger(level=log_level, sink=self._append_log_batch)
+        master.after(100, self._drain_log_queue)
+
     def _set_icon(self):
         """Sets the application window icon."""
         try:
@@ -184,27 +197,33 @@ class DownloaderApp:
             self._log_message('info', f"Selected directory: {directory}")
 
     def _log_message(self, level, message):
-        """Thread-safe method to append messages to the log area."""
-        prefix = f"[{level.upper()}] ".ljust(10) if level != 'info' else "[INFO]    ".ljust(10)
-        full_message = f"{prefix}{message}"
-
-        def append_log():
-            if self.log_area.winfo_exists():
-                current_state = self.log_area.cget('state')
-                self.log_area.configure(state='normal')
-                self.log_area.insert(tk.END, full_message + "\n")
-                self.log_area.configure(state=current_state)
-                self.log_area.see(tk.END)
-        try:
-            if self.master.winfo_exists():
-                self.master.after(0, append_log)
-            else:
-                 print(f"Log (window closed): {full_message}")
-        except tk.TclError:
-             print(f"Log (TclError, window closed?): {full_message}")
-        except Exception as e:
-            print(f"Error logging message: {e}")
-            print(f"Log message was: {full_message}")
+        """Records a message; the log writer forwards it to the log area in batches."""
+        self.logger.log(level, message)
+
+    def _append_log_batch(self, records):
+        """Log sink called on the writer thread: only queues the batch, never touches Tk."""
+        self._log_queue.put(records)
+
+    def _drain_log_queue(self):
+        """Main-thread poll appending queued log batches to the log area."""
+        batches = []
+        while True:
+            try:
+                batches.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batches and self.log_area.winfo_exists():
+            text = "".join(
+                (f"[{level.upper()}] ".ljust(10) if level != 'info' else "[INFO]    ") + message + "\n"
+                for records in batches for level, message in records
+            )
+            current_state = self.log_area.cget('state')
+            self.log_area.configure(state='normal')
+            self.log_area.insert(tk.END, text)
+            self.log_area.configure(state=current_state)
+            self.log_area.see(tk.END)
+        if self.master.winfo_exists():
+            self.master.after(100, self._drain_log_queue)
 
 
     def _update_progress(self, percent, message, status, filename):
@@ -315,7 +334,7 @@ class DownloaderApp:
                 directory,
                 extension,
                 self._update_progress, # Pass GUI update callback
-                self._log_message    # Pass GUI logging callback
+                self.logger          # Pass structured logger (callable as log_callback)
             )
 
             # --- Determine final status based on success ---
@@ -388,4 +407,5 @@ class DownloaderApp:
         except Exception as e:
             print(f"Error saving settings on close: {e}")
         finally:
+             self.logger.close() # Flush pending records to the log file
              if self.master: self.master.destroy()
\ No newline at end of file
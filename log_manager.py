@@ -0,0 +1,179 @@
+# log_manager.py
+import json
+import os
+import queue
+import threading
+import time
+
+LOG_DIR = 'logs'
+LOG_FILE_PATTERN = 'ytdownloader-%Y%m%d.jsonl'
+
+# Numeric levels; checks compare ints so disabled messages cost almost nothing
+LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40}
+DEFAULT_LEVEL = 'info'
+
+_STOP = object() # Sentinel telling the writer thread to drain and exit
+
+
+def _levelno(level):
+    """Maps a level name (any case) to its number; unknown names count as errors."""
+    levelno = LEVELS.get(level)
+    if levelno is None:
+        levelno = LEVELS.get(str(level).lower(), LEVELS['error'])
+    return levelno
+
+
+class StructuredLogger:
+    """
+    Queue-backed logger writing JSON-lines files from a background thread.
+
+    Callers only pay for a level check and a queue put: message formatting,
+    JSON encoding and file I/O all happen on the writer thread, in batches.
+    The optional sink (e.g. the GUI log view) receives batches of (level, message)
+    tuples at most once per sink_interval, after the batch is on disk. It is
+    called on the writer thread and must not block. When more than
+    sink_max_lines records arrive in one interval, the surplus debug/info
+    lines are dropped from the sink (never from the file) and summarised in
+    a single line.
+
+    Instances are callable as log(level, message), so they can be passed
+    anywhere a plain log_callback is expected.
+    """
+
+    def __init__(self, level=DEFAULT_LEVEL, log_dir=LOG_DIR, sink=None,
+                 sink_interval=0.1, sink_max_lines=200, batch_size=500):
+        """
+        Initializes the logger and starts its writer thread.
+
+        Args:
+            level (str): Minimum level recorded ('debug', 'info', 'warning', 'error'),
+                         case-insensitive. Raises ValueError for any other value.
+            log_dir (str | None): Directory for JSON-lines files, or None to disable file output.
+            sink (callable | None): Function called with a list of (level, message) tuples.
+            sink_interval (float): Minimum seconds between two sink calls.
+            sink_max_lines (int): Maximum records forwarded to the sink per call.
+            batch_size (int): Maximum records written to the file per batch.
+        """
+        if str(level).lower() not in LEVELS:
+            raise ValueError(f"Unknown log level: {level!r}")
+        self._min_level = _levelno(level)
+        self._log_dir = log_dir
+        self._sink = sink
+        self._sink_interval = sink_interval
+        self._sink_max_lines = sink_max_lines
+        self._batch_size = batch_size
+        self._queue = queue.SimpleQueue()
+        self._file = None
+        self._file_name = None
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def is_enabled(self, level):
+        """Returns True if messages at 'level' would be recorded."""
+        return _levelno(level) >= self._min_level
+
+    def log(self, level, msg, *args):
+        """
+        Queues a record if 'level' is enabled.
+
+        'msg' is %-formatted with 'args' on the writer thread, so pass values as
+        arguments rather than pre-formatting them. Unknown levels are recorded
+        under their own name but treated as errors.
+        """
+        levelno = _levelno(level)
+        if levelno < self._min_level:
+            return
+        self._queue.put((time.time(), str(level).lower(), levelno, msg, args))
+
+    __call__ = log
+
+    def close(self, timeout=2.0):
+        """
+        Flushes queued records to the log file and stops the writer thread.
+
+        The sink is detached first, so records still queued go to the file only.
+        """
+        self._sink = None
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    # --- Writer thread ---
+    def _run(self):
+        """Drains the queue in batches until the stop sentinel is seen."""
+        sink_pending = []
+        sink_dropped = 0
+        next_sink_time = time.monotonic()
+        running = True
+        while running:
+            try:
+                batch = [self._queue.get(timeout=self._sink_interval)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                batch = [record for record in batch if record is not _STOP]
+                running = False
+
+            lines = []
+            for created, level, levelno, msg, args in batch:
+                message = self._format(msg, args)
+                record = {'ts': round(created, 3), 'level': level, 'msg': message}
+                lines.append(json.dumps(record, ensure_ascii=False))
+                if self._sink is not None:
+                    if len(sink_pending) < self._sink_max_lines or levelno >= LEVELS['warning']:
+                        sink_pending.append((level, message))
+                    else:
+                        sink_dropped += 1
+            # File first: a slow sink must never hold back the log file
+            if lines:
+                self._write_lines(lines, created)
+
+            sink = self._sink
+            if sink is None:
+                sink_pending, sink_dropped = [], 0
+            elif (sink_pending or sink_dropped) and time.monotonic() >= next_sink_time:
+                if sink_dropped:
+                    sink_pending.append(('warning', f"... {sink_dropped} log line(s) suppressed in the log view (see log file)."))
+                try:
+                    sink(sink_pending)
+                except Exception as e:
+                    print(f"Error delivering log records: {e}")
+                sink_pending, sink_dropped = [], 0
+                next_sink_time = time.monotonic() + self._sink_interval
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _format(msg, args):
+        """Applies %-style arguments, falling back to the raw pieces on mismatch."""
+        if not args:
+            return str(msg)
+        try:
+            return str(msg) % args
+        except (TypeError, ValueError):
+            return " ".join([str(msg)] + [str(a) for a in args])
+
+    def _write_lines(self, lines, created):
+        """Appends JSON lines to the current day's log file in a single write."""
+        if not self._log_dir:
+            return
+        file_name = time.strftime(LOG_FILE_PATTERN, time.localtime(created))
+        try:
+            if self._file is None or file_name != self._file_name:
+                if self._file:
+                    self._file.close()
+                os.makedirs(self._log_dir, exist_ok=True)
+                self._file = open(os.path.join(self._log_dir, file_name), 'a', encoding='utf-8')
+                self._file_name = file_name
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+        except OSError as e:
+            print(f"Error writing log file in {self._log_dir}: {e}. File logging disabled.")
+            self._log_dir = None
+            self._file = None